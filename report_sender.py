@@ -9,10 +9,12 @@
 ====================================================
 """
 
+import html
 import os
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
 from datetime import datetime
 import gspread # pyright: ignore[reportMissingImports]
 from google.oauth2.service_account import Credentials # pyright: ignore[reportMissingImports]
@@ -24,88 +26,35 @@ load_dotenv()
 # ── CONFIG (reads from your .env file) ──
 SENDER_EMAIL    = os.getenv("SENDER_EMAIL")       # Your Gmail address
 SENDER_PASSWORD = os.getenv("SENDER_PASSWORD")    # Your Gmail App Password
-RECIPIENT_EMAIL = os.getenv("RECIPIENT_EMAIL")    # Who receives the report
+RECIPIENT_EMAIL = os.getenv("RECIPIENT_EMAIL")    # Who receives the report (comma-separate for several)
 SHEET_NAME      = os.getenv("SHEET_NAME")         # Your Google Sheet name
 BUSINESS_NAME   = os.getenv("BUSINESS_NAME", "Your Business")
 
+RECIPIENTS = [e.strip() for e in (RECIPIENT_EMAIL or "").split(",") if e.strip()]
 
-# ══════════════════════════════════════════
-#  STEP 1 — CONNECT TO GOOGLE SHEETS
-# ══════════════════════════════════════════
-
-def get_sheet_data():
-    """
-    Connects to Google Sheets using a service account
-    and returns all rows from the first sheet.
-    """
-    print("📊 Connecting to Google Sheets...")
-
-    # Tell Google which permissions we need
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets.readonly",
-        "https://www.googleapis.com/auth/drive.readonly"
-    ]
-
-    # Load credentials from the JSON file you downloaded from Google Cloud
-    creds = Credentials.from_service_account_file(
-        "credentials.json",
-        scopes=scopes
-    )
-
-    # Authorize and open the sheet
-    client = gspread.authorize(creds)
-    sheet  = client.open(SHEET_NAME).sheet1
-
-    # Get all values as a list of lists
-    data = sheet.get_all_records()  # Returns list of dicts using first row as keys
-
-    print(f"✅ Found {len(data)} rows of data.")
-    return data
-
-
-# ══════════════════════════════════════════
-#  STEP 2 — BUILD THE REPORT
-# ══════════════════════════════════════════
-
-def build_report(data):
-    """
-    Takes the sheet data and builds a clean HTML email report.
-    This is what the client sees in their inbox.
-    """
-    print("📝 Building report...")
+# Most SMTP connections to open at once when there are several recipients
+# (Gmail limits how many a single account can have open)
+MAX_SMTP_CONNECTIONS = 3
 
-    today      = datetime.now().strftime("%B %d, %Y")
-    week_start = datetime.now().strftime("%A, %B %d")
+# ── Table styling (shared by every row, so build these once) ──
+ROW_BG_EVEN = "#f9f7f4"
+ROW_BG_ODD  = "#ffffff"
+TR_ROW      = "<tr style='background:%s;'>%s</tr>"
+TD_CELL     = "<td style='padding:10px 14px; border-bottom:1px solid #eee;'>%s</td>"
 
-    # ── Calculate summary stats (adjust column names to match your sheet) ──
-    # We assume your sheet has columns: Item, Sales, Revenue, Status
-    # Change these to match whatever YOUR sheet has
-    try:
-        total_sales   = sum(int(row.get("Sales", 0))   for row in data)
-        total_revenue = sum(float(row.get("Revenue", 0)) for row in data)
-        completed     = sum(1 for row in data if str(row.get("Status", "")).lower() == "completed")
-    except Exception:
-        total_sales, total_revenue, completed = 0, 0, 0
+# ── Tell Google which permissions we need ──
+SCOPES = (
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/drive.readonly",
+)
 
-    # ── Build the table rows from sheet data ──
-    table_rows = ""
-    for i, row in enumerate(data):
-        bg = "#f9f7f4" if i % 2 == 0 else "#ffffff"
-        cells = "".join(f"<td style='padding:10px 14px; border-bottom:1px solid #eee;'>{v}</td>"
-                        for v in row.values())
-        table_rows += f"<tr style='background:{bg};'>{cells}</tr>"
-
-    # ── Column headers ──
-    if data:
-        headers = "".join(
-            f"<th style='padding:12px 14px; text-align:left; background:#1a1a2e; color:#fff; font-weight:600;'>{col}</th>"
-            for col in data[0].keys()
-        )
-    else:
-        headers = "<th>No data found</th>"
+# Authorized Google client, created on first use and then reused
+_client = None
 
-    # ── Full HTML email template ──
-    html = f"""
+# ── Full HTML email template ──
+# Built once when the script loads; build_report only fills in the $ slots.
+# ($$ is a literal dollar sign.)
+REPORT_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head><meta charset="UTF-8"/></head>
@@ -116,8 +65,8 @@ def build_report(data):
         <!-- HEADER -->
         <div style="background:#1a1a2e; padding:32px 36px;">
           <div style="font-size:12px; letter-spacing:0.2em; color:#7a8aaa; text-transform:uppercase; margin-bottom:8px;">Automated Weekly Report</div>
-          <div style="font-size:26px; font-weight:700; color:#ffffff;">{BUSINESS_NAME}</div>
-          <div style="font-size:13px; color:#9aa3b8; margin-top:6px;">Generated on {today}</div>
+          <div style="font-size:26px; font-weight:700; color:#ffffff;">$BUSINESS_NAME</div>
+          <div style="font-size:13px; color:#9aa3b8; margin-top:6px;">Generated on $TODAY</div>
         </div>
 
         <!-- SUMMARY STATS -->
@@ -126,17 +75,17 @@ def build_report(data):
           <div style="display:flex; gap:20px; flex-wrap:wrap;">
 
             <div style="flex:1; min-width:140px; background:#fff; border-radius:6px; padding:18px 20px; border:1px solid #eee;">
-              <div style="font-size:28px; font-weight:700; color:#1a1a2e;">{total_sales}</div>
+              <div style="font-size:28px; font-weight:700; color:#1a1a2e;">$TOTAL_SALES</div>
               <div style="font-size:12px; color:#999; margin-top:4px;">Total Sales</div>
             </div>
 
             <div style="flex:1; min-width:140px; background:#fff; border-radius:6px; padding:18px 20px; border:1px solid #eee;">
-              <div style="font-size:28px; font-weight:700; color:#2d6a4f;">${total_revenue:,.2f}</div>
+              <div style="font-size:28px; font-weight:700; color:#2d6a4f;">$$$TOTAL_REVENUE</div>
               <div style="font-size:12px; color:#999; margin-top:4px;">Total Revenue</div>
             </div>
 
             <div style="flex:1; min-width:140px; background:#fff; border-radius:6px; padding:18px 20px; border:1px solid #eee;">
-              <div style="font-size:28px; font-weight:700; color:#c8531a;">{completed}</div>
+              <div style="font-size:28px; font-weight:700; color:#c8531a;">$COMPLETED</div>
               <div style="font-size:12px; color:#999; margin-top:4px;">Completed Orders</div>
             </div>
 
@@ -148,8 +97,8 @@ def build_report(data):
           <div style="font-size:11px; letter-spacing:0.15em; color:#999; text-transform:uppercase; margin-bottom:16px;">Full Data Breakdown</div>
           <div style="overflow-x:auto;">
             <table style="width:100%; border-collapse:collapse; font-size:13px;">
-              <thead><tr>{headers}</tr></thead>
-              <tbody>{table_rows}</tbody>
+              <thead><tr>$HEADERS</tr></thead>
+              <tbody>$ROWS</tbody>
             </table>
           </div>
         </div>
@@ -163,42 +112,235 @@ def build_report(data):
       </div>
     </body>
     </html>
+    """)
+
+# Template values for the report sent when the sheet has no rows —
+# everything except the date, which build_report adds
+EMPTY_REPORT_VALUES = {
+    "BUSINESS_NAME": BUSINESS_NAME,
+    "TOTAL_SALES":   0,
+    "TOTAL_REVENUE": "0.00",
+    "COMPLETED":     0,
+    "HEADERS":       "<th>No data found</th>",
+    "ROWS":          "",
+}
+
+# Header row HTML, keyed by the sheet's column names
+_header_cells_cache = {}
+
+
+# ══════════════════════════════════════════
+#  STEP 1 — CONNECT TO GOOGLE SHEETS
+# ══════════════════════════════════════════
+
+def _get_client():
+    """
+    Returns the authorized gspread client, logging in only the first time.
+    Later calls reuse the same client (and its OAuth token).
+    """
+    global _client
+    if _client is None:
+        # Load credentials from the JSON file you downloaded from Google Cloud
+        creds = Credentials.from_service_account_file(
+            "credentials.json",
+            scopes=SCOPES
+        )
+        _client = gspread.authorize(creds)
+    return _client
+
+
+def get_sheet_data():
+    """
+    Connects to Google Sheets using a service account
+    and returns (headers, rows) from the first sheet.
     """
+    print("📊 Connecting to Google Sheets...")
+
+    # Authorize (once) and open the sheet
+    sheet = _get_client().open(SHEET_NAME).sheet1
+
+    # Get all values as a list of lists — first row is the column headers.
+    # (Cheaper than get_all_records(), which builds a dict for every row.)
+    rows = sheet.get_all_values()
+    headers, data = (rows[0], rows[1:]) if rows else ([], [])
+
+    print(f"✅ Found {len(data)} rows of data.")
+    return headers, data
+
+
+# ══════════════════════════════════════════
+#  STEP 2 — BUILD THE REPORT
+# ══════════════════════════════════════════
+
+def _to_number(value):
+    """
+    Turns a sheet cell like "1,234.50" into a float (blank cells count as 0).
+    Thousands separators are stripped, like gspread's get_all_records() does.
+    """
+    return float(value.replace(",", "") or 0)
+
+
+def build_report(headers, data, today):
+    """
+    Takes the sheet headers and rows and builds a clean HTML email report.
+    The date shown on the report is passed in as "today".
+    This is what the client sees in their inbox.
+    """
+    print("📝 Building report...")
+
+    # Nothing to show — skip the table work and send the empty report
+    if not data:
+        print("✅ Report built (no rows found).")
+        return REPORT_TEMPLATE.substitute(EMPTY_REPORT_VALUES, TODAY=today)
+
+    # ── Calculate summary stats and build the table rows in one pass ──
+    # We assume your sheet has columns: Item, Sales, Revenue, Status
+    # Change these to match whatever YOUR sheet has
+    sales_idx   = headers.index("Sales")   if "Sales"   in headers else None
+    revenue_idx = headers.index("Revenue") if "Revenue" in headers else None
+    status_idx  = headers.index("Status")  if "Status"  in headers else None
+
+    total_sales, total_revenue, completed = 0, 0.0, 0
+    stats_ok = True
+
+    # Collect each row in a list and join once at the end — adding to a
+    # string with += copies everything built so far on every row.
+    parts = []
+
+    # Look these up once here instead of on every row/cell inside the loop
+    # (get_all_values() already gives us strings, so no str() calls needed)
+    append    = parts.append
+    escape    = html.escape
+    to_number = _to_number
+    tr_row    = TR_ROW
+    td_cell   = TD_CELL
+    bg_even   = ROW_BG_EVEN
+    bg_odd    = ROW_BG_ODD
+
+    # A Status column only has a handful of distinct values, so remember
+    # whether each one means "completed" instead of lower()-ing every row
+    is_completed = {}
+
+    for i, row in enumerate(data):
+        if stats_ok:
+            try:
+                sales   = row[sales_idx]   if sales_idx   is not None else ""
+                revenue = row[revenue_idx] if revenue_idx is not None else ""
+                status  = row[status_idx]  if status_idx  is not None else ""
+                total_sales   += int(to_number(sales))
+                total_revenue += to_number(revenue)
+                done = is_completed.get(status)
+                if done is None:
+                    done = is_completed[status] = status.lower() == "completed"
+                if done:
+                    completed += 1
+            except Exception:
+                stats_ok = False
+
+        bg = bg_even if i % 2 == 0 else bg_odd
+        # Escape cell text so values like "<", ">" or "&" can't break the table
+        cells = "".join([td_cell % escape(v) for v in row])
+        append(tr_row % (bg, cells))
+    table_rows = "".join(parts)
+
+    # A bad value anywhere means the totals can't be trusted — show zeros
+    if not stats_ok:
+        total_sales, total_revenue, completed = 0, 0, 0
+
+    # ── Column headers (same columns → reuse the HTML we built last time) ──
+    columns = tuple(headers)
+    header_cells = _header_cells_cache.get(columns)
+    if header_cells is None:
+        header_cells = "".join(
+            f"<th style='padding:12px 14px; text-align:left; background:#1a1a2e; color:#fff; font-weight:600;'>{html.escape(str(col))}</th>"
+            for col in columns
+        )
+        _header_cells_cache[columns] = header_cells
+
+    # ── Fill in the HTML email template ──
+    report = REPORT_TEMPLATE.substitute(
+        BUSINESS_NAME=BUSINESS_NAME,
+        TODAY=today,
+        TOTAL_SALES=total_sales,
+        TOTAL_REVENUE=f"{total_revenue:,.2f}",
+        COMPLETED=completed,
+        HEADERS=header_cells,
+        ROWS=table_rows,
+    )
 
     print("✅ Report built.")
-    return html
+    return report
 
 
 # ══════════════════════════════════════════
 #  STEP 3 — SEND THE EMAIL
 # ══════════════════════════════════════════
 
-def send_email(html_content):
+def _open_smtp():
     """
-    Sends the HTML report via Gmail using SMTP.
+    Connects and logs in to Gmail's SMTP server.
+    Returns the open connection — the caller is responsible for closing it.
     """
-    print(f"📧 Sending report to {RECIPIENT_EMAIL}...")
+    server = smtplib.SMTP_SSL("smtp.gmail.com", 465)
+    try:
+        server.login(SENDER_EMAIL, SENDER_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def send_email(server, html_content, recipient, today):
+    """
+    Sends the HTML report to one recipient over an
+    already logged-in Gmail SMTP connection.
+    """
+    print(f"📧 Sending report to {recipient}...")
 
-    today   = datetime.now().strftime("%B %d, %Y")
     subject = f"📊 Weekly Business Report — {today} | {BUSINESS_NAME}"
 
     # Create the email
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"]    = SENDER_EMAIL
-    msg["To"]      = RECIPIENT_EMAIL
+    msg["To"]      = recipient
 
-    # Attach the HTML content
-    msg.attach(MIMEText(html_content, "html"))
+    # Plain-text fallback first, then the HTML report as the preferred version
+    msg.set_content(f"Your weekly report for {BUSINESS_NAME} is best viewed in an HTML email client.")
+    # base64 is encoded in C, unlike the default quoted-printable scan
+    msg.add_alternative(html_content, subtype="html", cte="base64")
 
-    # Connect to Gmail's SMTP server and send
-    with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-        server.login(SENDER_EMAIL, SENDER_PASSWORD)
-        server.sendmail(SENDER_EMAIL, RECIPIENT_EMAIL, msg.as_string())
+    # Hand the message straight to SMTP (sent as bytes, no as_string() copy)
+    server.send_message(msg)
 
     print("✅ Email sent successfully!")
 
 
+def send_batch(recipients, html_content, today, server=None):
+    """
+    Sends the report to each recipient in the batch, over `server` if given
+    or else over a new SMTP connection. Used to send to several batches at
+    the same time. Never raises — returns a list of (recipient, error) for
+    every recipient that didn't get the report.
+    """
+    failed  = []
+    pending = list(recipients)
+    try:
+        if server is None:
+            server = _open_smtp()
+        with server:
+            while pending:
+                recipient = pending.pop(0)
+                try:
+                    send_email(server, html_content, recipient, today)
+                except Exception as e:
+                    failed.append((recipient, e))
+    except Exception as e:
+        # Couldn't connect or log in — nobody left in this batch got the report
+        failed += [(recipient, e) for recipient in pending]
+    return failed
+
+
 # ══════════════════════════════════════════
 #  MAIN — Run everything
 # ══════════════════════════════════════════
@@ -208,9 +350,56 @@ if __name__ == "__main__":
     print("=" * 45)
 
     try:
-        data         = get_sheet_data()
-        html_report  = build_report(data)
-        send_email(html_report)
+        # Work out the date once so the subject and report always match
+        today = datetime.now().strftime("%B %d, %Y")
+
+        # Nobody to send to is a config mistake, not a successful run
+        if not RECIPIENTS:
+            raise ValueError("RECIPIENT_EMAIL is not set")
+
+        # Split recipients into batches, one SMTP connection per batch,
+        # so a long recipient list isn't sent strictly one after another
+        n_batches = min(MAX_SMTP_CONNECTIONS, len(RECIPIENTS))
+        batches   = [RECIPIENTS[k::n_batches] for k in range(n_batches)]
+
+        # Log in to Gmail in the background while we pull the sheet —
+        # both are network waits on different servers, so they can overlap
+        with ThreadPoolExecutor(max_workers=n_batches) as pool:
+            smtp_future = pool.submit(_open_smtp)
+
+            try:
+                headers, data = get_sheet_data()
+                html_report   = build_report(headers, data, today)
+            except Exception:
+                # Don't leave the SMTP connection hanging if the sheet step failed
+                if smtp_future.exception() is None:
+                    smtp_future.result().close()
+                raise
+
+            # Any extra batches get their own connections in the background...
+            batch_futures = [
+                pool.submit(send_batch, batch, html_report, today)
+                for batch in batches[1:]
+            ]
+
+            # ...while the first batch reuses the connection opened above
+            try:
+                server = smtp_future.result()
+            except Exception as e:
+                failed = [(recipient, e) for recipient in batches[0]]
+            else:
+                failed = send_batch(batches[0], html_report, today, server)
+
+            # Wait for every batch so no failure goes unreported
+            for future in batch_futures:
+                failed += future.result()
+
+        if failed:
+            for recipient, error in failed:
+                print(f"❌ Could not send to {recipient}: {error}")
+            raise RuntimeError(
+                f"Report not sent to {len(failed)} of {len(RECIPIENTS)} recipient(s)"
+            )
 
         print("=" * 45)
         print("🎉 Done! Report sent successfully.\n")